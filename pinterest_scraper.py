@@ -5,33 +5,174 @@ Downloads all images from a Pinterest board to a local directory using your exis
 
 Requirements:
 - selenium
-- pillow
 - requests
 
 Install with:
-pip install selenium pillow requests
+pip install selenium requests
 """
 
 import os
 import sys
-import time
+import contextlib
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import ProtocolError
+from urllib3.util.retry import Retry
 import subprocess
 import platform
+import shutil
+import tempfile
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.options import Options
+from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import TimeoutException, NoSuchElementException
-from PIL import Image
-import io
 import hashlib
+import re
+from functools import lru_cache
+
+# Elements that only appear when logged into Pinterest
+LOGGED_IN_LOCATORS = (
+    "//div[@data-test-id='header-profile']",
+    "//div[contains(@class, 'profile')]",
+    "//a[contains(@href, '/settings/')]",
+    "//button[contains(@aria-label, 'Profile')]",
+)
+
+# Elements that only appear on the login page
+LOGIN_LOCATORS = (
+    "//button[contains(text(), 'Log in')]",
+    "//div[contains(text(), 'Welcome to Pinterest')]",
+    "//input[@type='email']",
+)
+
+# Union XPaths so each check is a single driver round-trip
+LOGGED_IN_XPATH = " | ".join(LOGGED_IN_LOCATORS)
+LOGIN_XPATH = " | ".join(LOGIN_LOCATORS)
+
+PIN_IMG_XPATH = "//img[contains(@src, 'pinimg.com')]"
+
+# Whether any element matching an XPath is visible, checked entirely in the browser
+ANY_VISIBLE_JS = """
+const nodes = document.evaluate(arguments[0], document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+for (let i = 0; i < nodes.snapshotLength; i++) {
+    const node = nodes.snapshotItem(i);
+    const style = window.getComputedStyle(node);
+    if (node.getClientRects().length && style.visibility !== 'hidden' && style.display !== 'none') {
+        return true;
+    }
+}
+return false;
+"""
+
+# Analytics, ads and beacons that slow page loads without adding pins
+BLOCKED_URL_PATTERNS = (
+    "*google-analytics*",
+    "*googletagmanager*",
+    "*doubleclick*",
+    "*segment.io*",
+    "*sentry.io*",
+    "*facebook.net*",
+    "*ct.pinterest.com*",
+)
+
+# Returns the src of every Pinterest image, preferring the largest srcset candidate
+EXTRACT_IMAGE_URLS_JS = """
+return Array.from(document.querySelectorAll('img')).map(img => {
+    let best = img.currentSrc || img.src || img.getAttribute('data-src');
+    let bestWidth = 0;
+    for (const candidate of (img.srcset || '').split(',')) {
+        const [url, descriptor] = candidate.trim().split(/\\s+/);
+        const width = parseFloat(descriptor) || 0;
+        if (url && width > bestWidth) {
+            best = url;
+            bestWidth = width;
+        }
+    }
+    return best;
+}).filter(src => src && src.includes('pinimg.com'));
+"""
+
+# Scrolls until the page stops growing. A MutationObserver schedules the next
+# scroll once new pins settle, and the script resolves after quiet_ms without growth.
+SCROLL_UNTIL_STABLE_JS = """
+const [maxScrolls, quietMs, settleMs, done] = arguments;
+let scrolls = 0;
+let lastHeight = document.body.scrollHeight;
+let timer;
+const finish = () => {
+    observer.disconnect();
+    clearTimeout(timer);
+    done({scrolls: scrolls, height: document.body.scrollHeight});
+};
+const step = () => {
+    if (scrolls >= maxScrolls) return finish();
+    scrolls++;
+    window.scrollTo(0, document.body.scrollHeight);
+    clearTimeout(timer);
+    timer = setTimeout(finish, quietMs);
+};
+const observer = new MutationObserver(() => {
+    const height = document.body.scrollHeight;
+    if (height > lastHeight) {
+        lastHeight = height;
+        clearTimeout(timer);
+        timer = setTimeout(step, settleMs);
+    }
+});
+observer.observe(document.body, {childList: true, subtree: true});
+step();
+"""
+
+# Delay after the last mutation before scrolling again
+SCROLL_SETTLE_MS = 250
+
+# Attempts per image when a transfer ends short of its Content-Length
+DOWNLOAD_ATTEMPTS = 2
+
+# Size segment of a pinimg.com URL, e.g. /236x/, /75x75_RS/ or /originals/
+SIZE_SEGMENT_RE = re.compile(r'/(?:\d+x\w*|originals)/')
+
+def is_image_data(head):
+    """Check the leading bytes of a file for a JPEG, PNG, GIF or WebP signature"""
+    return (
+        head[:3] == b'\xff\xd8\xff'
+        or head[:8] == b'\x89PNG\r\n\x1a\n'
+        or head[:4] == b'GIF8'
+        or (head[:4] == b'RIFF' and head[8:12] == b'WEBP')
+    )
+
+@lru_cache(maxsize=4096)
+def url_hash(img_url):
+    """Short hash of an image URL, used to name and deduplicate downloads"""
+    return hashlib.md5(img_url.encode()).hexdigest()[:8]
 
 class PinterestScraper:
-    def __init__(self, headless=False):
-        self.setup_driver(headless)
+    def __init__(self, headless=False, max_workers=16):
+        self.headless = headless
         self.downloaded_urls = set()
+        self.max_workers = max_workers
+        self.logged_in = False
+        self._lock = threading.Lock()
+        
+    def __enter__(self):
+        """Start Chrome and the HTTP session once for every board scraped"""
+        self.setup_driver(self.headless)
+        self.block_trackers()
+        self.setup_session()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback):
+        """Close the HTTP session and Chrome"""
+        if hasattr(self, 'session'):
+            self.session.close()
+        if hasattr(self, 'driver'):
+            self.driver.quit()
+            print("🔚 Browser closed")
         
     def get_chrome_profile_path(self):
         """Get the path to Chrome's default profile on macOS"""
@@ -50,6 +191,21 @@ class PinterestScraper:
         print("⚠️  Default Chrome profile not found, using temporary profile")
         return None
         
+    def setup_session(self):
+        """Setup a shared HTTP session with keep-alive and retries for downloads"""
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=32,
+            # Keep a connection per worker so none are discarded and re-handshaked
+            pool_maxsize=max(32, self.max_workers),
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Referer': 'https://www.pinterest.com/',
+        })
+        
     def setup_driver(self, headless):
         """Setup Chrome driver with user profile"""
         print("Setting up Chrome driver with user profile...")
@@ -80,6 +236,16 @@ class PinterestScraper:
         chrome_options.add_experimental_option("excludeSwitches", ["enable-automation"])
         chrome_options.add_experimental_option('useAutomationExtension', False)
         
+        # Return from navigation on DOMContentLoaded instead of waiting for every image
+        chrome_options.page_load_strategy = 'eager'
+        
+        # Don't fetch or decode images in the browser, only their src attributes are needed
+        chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+        chrome_options.add_experimental_option("prefs", {
+            "profile.managed_default_content_settings.images": 2,
+            "profile.default_content_setting_values.notifications": 2,
+        })
+        
         try:
             # Let Selenium find Chrome automatically
             self.driver = webdriver.Chrome(options=chrome_options)
@@ -93,27 +259,25 @@ class PinterestScraper:
     def setup_driver_alternative(self, chrome_options):
         """Alternative methods for macOS"""
         try:
-            # Try common chromedriver paths
-            possible_paths = [
-                '/usr/local/bin/chromedriver',
-                '/opt/homebrew/bin/chromedriver',
-                '/Applications/Google Chrome.app/Contents/MacOS/chromedriver'
-            ]
-            
-            for path in possible_paths:
-                if os.path.exists(path):
-                    print(f"Trying chromedriver at: {path}")
-                    self.driver = webdriver.Chrome(executable_path=path, options=chrome_options)
-                    return
-            
-            # Final attempt
-            self.driver = webdriver.Chrome(options=chrome_options)
+            # Look up chromedriver on PATH, falling back to the Homebrew location
+            path = shutil.which('chromedriver') or '/opt/homebrew/bin/chromedriver'
+            print(f"Trying chromedriver at: {path}")
+            self.driver = webdriver.Chrome(service=Service(path), options=chrome_options)
             
         except Exception as e:
             print(f"All methods failed: {e}")
             print("\nPlease install ChromeDriver: brew install chromedriver")
             raise
         
+    def block_trackers(self):
+        """Block analytics and ad requests in the browser through the DevTools protocol"""
+        try:
+            self.driver.execute_cdp_cmd("Network.enable", {})
+            self.driver.execute_cdp_cmd("Network.setBlockedURLs", {"urls": list(BLOCKED_URL_PATTERNS)})
+            print(f"✓ Blocking {len(BLOCKED_URL_PATTERNS)} tracker URL patterns")
+        except Exception as e:
+            print(f"⚠️  Could not block trackers: {e}")
+        
     def check_login_status(self):
         """Check if we're logged into Pinterest"""
         print("Checking Pinterest login status...")
@@ -121,42 +285,26 @@ class PinterestScraper:
         try:
             # Try to access Pinterest home page
             self.driver.get("https://www.pinterest.com")
-            time.sleep(3)
             
-            # Look for login indicators or profile elements
-            logged_in_indicators = [
-                "//div[@data-test-id='header-profile']",
-                "//div[contains(@class, 'profile')]",
-                "//a[contains(@href, '/settings/')]",
-                "//button[contains(@aria-label, 'Profile')]"
-            ]
+            # Navigation returns at DOMContentLoaded, so wait for the header to render
+            try:
+                WebDriverWait(self.driver, 10).until(
+                    EC.presence_of_element_located((By.XPATH, f"{LOGGED_IN_XPATH} | {LOGIN_XPATH}"))
+                )
+            except TimeoutException:
+                print("Timeout waiting for login indicators")
             
-            for indicator in logged_in_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, indicator)
-                    if element.is_displayed():
-                        print("✓ Successfully logged into Pinterest!")
-                        return True
-                except:
-                    continue
+            # Look for profile elements, all locators in a single driver call
+            if self.driver.execute_script(ANY_VISIBLE_JS, LOGGED_IN_XPATH):
+                print("✓ Successfully logged into Pinterest!")
+                return True
             
             # Check for login page indicators
-            login_indicators = [
-                "//button[contains(text(), 'Log in')]",
-                "//div[contains(text(), 'Welcome to Pinterest')]",
-                "//input[@type='email']"
-            ]
-            
-            for indicator in login_indicators:
-                try:
-                    element = self.driver.find_element(By.XPATH, indicator)
-                    if element.is_displayed():
-                        print("❌ Not logged into Pinterest")
-                        print("💡 Please log in manually in the browser window that opened")
-                        input("Press Enter after you've logged in to Pinterest...")
-                        return self.verify_login_after_manual()
-                except:
-                    continue
+            if self.driver.execute_script(ANY_VISIBLE_JS, LOGIN_XPATH):
+                print("❌ Not logged into Pinterest")
+                print("💡 Please log in manually in the browser window that opened")
+                input("Press Enter after you've logged in to Pinterest...")
+                return self.verify_login_after_manual()
                     
             print("⚠️  Could not determine login status")
             return True
@@ -168,125 +316,136 @@ class PinterestScraper:
     def verify_login_after_manual(self):
         """Verify login after manual intervention"""
         print("Verifying login...")
-        time.sleep(3)
         return self.check_login_status()
         
-    def scroll_to_bottom(self, max_scrolls=30):
+    def scroll_to_bottom(self, max_scrolls=30, quiet_ms=5000):
         """Scroll to bottom of page to load all images"""
         print("Scrolling to load all images...")
         
-        last_height = self.driver.execute_script("return document.body.scrollHeight")
-        no_change_count = 0
+        # Run the whole scroll loop in the browser, driven by DOM mutations
+        self.driver.set_script_timeout(max_scrolls * (quiet_ms + SCROLL_SETTLE_MS) / 1000 + 30)
+        result = self.driver.execute_async_script(
+            SCROLL_UNTIL_STABLE_JS, max_scrolls, quiet_ms, SCROLL_SETTLE_MS
+        )
         
-        for i in range(max_scrolls):
-            # Scroll down
-            self.driver.execute_script("window.scrollTo(0, document.body.scrollHeight);")
-            time.sleep(2)
-            
-            # Get new height
-            new_height = self.driver.execute_script("return document.body.scrollHeight")
-            
-            if new_height == last_height:
-                no_change_count += 1
-                if no_change_count >= 3:
-                    print("Reached bottom of page")
-                    break
-            else:
-                no_change_count = 0
-                last_height = new_height
-            
-            print(f"Scroll {i+1}/{max_scrolls} - Height: {new_height}px")
+        if result['scrolls'] < max_scrolls:
+            print("Reached bottom of page")
+        print(f"Scrolled {result['scrolls']}/{max_scrolls} times - Height: {result['height']}px")
 
     def extract_image_urls(self):
         """Extract high-quality image URLs from the board"""
         print("Extracting image URLs...")
-        image_urls = set()
         
-        try:
-            # Wait for pins to load
-            WebDriverWait(self.driver, 15).until(
-                EC.presence_of_element_located((By.XPATH, "//img[contains(@src, 'pinimg.com')]"))
-            )
-            
-            # Find Pinterest images
-            images = self.driver.find_elements(By.XPATH, "//img[contains(@src, 'pinimg.com')]")
-            print(f"Found {len(images)} Pinterest images")
-            
-            for img in images:
-                try:
-                    src = img.get_attribute('src')
-                    if src:
-                        # Get higher resolution if possible
-                        if '236x' in src:
-                            high_res = src.replace('236x', '736x')
-                            image_urls.add(high_res)
-                        elif '564x' in src:
-                            high_res = src.replace('564x', '736x')
-                            image_urls.add(high_res)
-                        else:
-                            image_urls.add(src)
-                except:
-                    continue
-                    
-        except TimeoutException:
-            print("Timeout waiting for images to load")
-            # Try alternative approach
-            images = self.driver.find_elements(By.TAG_NAME, "img")
-            for img in images:
-                src = img.get_attribute('src')
-                if src and 'pinimg.com' in src:
-                    image_urls.add(src)
-            
-        # Convert to list and filter
-        urls = [url for url in image_urls if url]
+        # Collect every candidate URL in a single driver round-trip
+        srcs = self.driver.execute_script(EXTRACT_IMAGE_URLS_JS) or []
+        print(f"Found {len(srcs)} Pinterest images")
+        
+        # Normalize every size variant of a pin to its original resolution,
+        # deduplicating while keeping board order so pin numbering is stable
+        urls = list(dict.fromkeys(
+            SIZE_SEGMENT_RE.sub('/originals/', src, count=1) for src in srcs
+        ))
         print(f"Extracted {len(urls)} unique image URLs")
         return urls
 
-    def download_image(self, img_url, folder_path, img_num):
+    def plan_downloads(self, image_urls, folder_path):
+        """Map image URLs to filenames, skipping ones already in the folder"""
+        # One directory read instead of a stat per image
+        with os.scandir(folder_path) as entries:
+            existing = {entry.name for entry in entries}
+        
+        # Earlier runs may have numbered pins differently, so match on the URL hash
+        existing_hashes = {
+            name[-12:-4] for name in existing
+            if name.startswith('pinterest_') and name.endswith('.jpg')
+        }
+        
+        plan = []
+        skipped = 0
+        for img_num, img_url in enumerate(image_urls, 1):
+            # Hash the 736x form so files saved before URLs were normalized still match
+            img_hash = url_hash(SIZE_SEGMENT_RE.sub('/736x/', img_url, count=1))
+            if img_hash in existing_hashes:
+                self.downloaded_urls.add(img_url)
+                skipped += 1
+                continue
+            plan.append((img_url, f"pinterest_{img_num:04d}_{img_hash}.jpg"))
+        
+        return plan, skipped
+
+    def download_image(self, img_url, folder_path, filename):
         """Download and save individual image"""
+        tmp_path = None
         try:
-            if img_url in self.downloaded_urls:
-                return False
+            with self._lock:
+                if img_url in self.downloaded_urls:
+                    return False
                 
-            # Create filename
-            url_hash = hashlib.md5(img_url.encode()).hexdigest()[:8]
-            filename = f"pinterest_{img_num:04d}_{url_hash}.jpg"
             filepath = os.path.join(folder_path, filename)
             
-            if os.path.exists(filepath):
-                print(f"✓ Already exists: {filename}")
-                self.downloaded_urls.add(img_url)
-                return True
-            
-            # Download headers
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
-                'Referer': 'https://www.pinterest.com/',
-            }
-            
-            # Download image
-            response = requests.get(img_url, headers=headers, timeout=30)
-            response.raise_for_status()
+            response = self.session.get(img_url, stream=True, timeout=(5, 30))
+            download_url = img_url
+            if response.status_code == 404 and '/originals/' in img_url:
+                # Not every pin keeps its original, fall back to the largest thumbnail
+                response.close()
+                download_url = img_url.replace('/originals/', '/736x/', 1)
+                response = self.session.get(download_url, stream=True, timeout=(5, 30))
             
-            # Verify it's an image
-            try:
-                image = Image.open(io.BytesIO(response.content))
-                image.verify()
-            except:
-                print(f"✗ Invalid image format: {filename}")
+            # Stream image straight to a uniquely named temporary file
+            for attempt in range(DOWNLOAD_ATTEMPTS):
+                if attempt:
+                    response = self.session.get(download_url, stream=True, timeout=(5, 30))
+                
+                with response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    
+                    try:
+                        # Verify it's an image from its leading bytes
+                        head = response.raw.read(16)
+                        if not is_image_data(head):
+                            print(f"✗ Invalid image format: {filename}")
+                            return False
+                        
+                        fd, tmp_path = tempfile.mkstemp(prefix='.dl_', dir=folder_path)
+                        with os.fdopen(fd, 'wb') as f:
+                            os.fchmod(f.fileno(), 0o644)
+                            f.write(head)
+                            shutil.copyfileobj(response.raw, f, length=64 * 1024)
+                            written = f.tell()
+                    except ProtocolError as e:
+                        # urllib3 raises when the body ends short of its Content-Length
+                        incomplete = str(e)
+                    else:
+                        # A complete transfer is byte-for-byte what the CDN served
+                        expected = response.headers.get('Content-Length')
+                        if expected is None or 'Content-Encoding' in response.headers or int(expected) == written:
+                            break
+                        incomplete = f"{written}/{expected} bytes"
+                
+                if tmp_path:
+                    os.remove(tmp_path)
+                    tmp_path = None
+                print(f"✗ Incomplete download ({incomplete}): {filename}")
+            else:
                 return False
             
-            # Save image
-            with open(filepath, 'wb') as f:
-                f.write(response.content)
+            # Atomically move the finished file into place
+            os.replace(tmp_path, filepath)
+            tmp_path = None
                 
-            self.downloaded_urls.add(img_url)
-            print(f"✓ Downloaded: {filename} ({len(response.content)//1024} KB)")
+            with self._lock:
+                self.downloaded_urls.add(img_url)
+            print(f"✓ Downloaded: {filename} ({os.path.getsize(filepath)//1024} KB)")
             return True
             
         except Exception as e:
-            print(f"✗ Failed to download image {img_num}: {str(e)}")
+            print(f"✗ Failed to download {filename}: {str(e)}")
             return False
+        finally:
+            if tmp_path:
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
 
     def scrape_board(self, board_url, output_folder):
         """Main method to scrape images from Pinterest board"""
@@ -298,16 +457,26 @@ class PinterestScraper:
         # Create output directory
         os.makedirs(output_folder, exist_ok=True)
         
+        # Pins shared between boards must still be saved to each board's folder
+        self.downloaded_urls.clear()
+        
         try:
-            # First check login status
-            if not self.check_login_status():
-                print("❌ Login check failed. Please ensure you're logged into Pinterest in Chrome.")
-                return
+            # First check login status, once per browser session
+            if not self.logged_in:
+                if not self.check_login_status():
+                    print("❌ Login check failed. Please ensure you're logged into Pinterest in Chrome.")
+                    return
+                self.logged_in = True
                 
             # Navigate to board
             print(f"🌐 Loading board: {board_url}")
             self.driver.get(board_url)
-            time.sleep(5)
+            try:
+                WebDriverWait(self.driver, 15).until(
+                    EC.presence_of_element_located((By.XPATH, PIN_IMG_XPATH))
+                )
+            except TimeoutException:
+                print("Timeout waiting for images to load")
             
             # Check if board loaded successfully
             if "pinterest.com" not in self.driver.current_url or "login" in self.driver.current_url:
@@ -324,18 +493,34 @@ class PinterestScraper:
                 print("❌ No images found on this board!")
                 return
                 
+            # Skip pins already downloaded by an earlier run
+            plan, successful = self.plan_downloads(image_urls, output_folder)
+            if successful:
+                print(f"✓ Already exists: {successful} images")
+                
             # Download images
-            print(f"\n⬇️  Downloading {len(image_urls)} images...")
-            successful = 0
+            print(f"\n⬇️  Downloading {len(plan)} images...")
             
-            for i, img_url in enumerate(image_urls, 1):
-                if self.download_image(img_url, output_folder, i):
-                    successful += 1
-                
-                time.sleep(0.5)
+            # Downloads are independent I/O, so run them in parallel
+            workers = max(1, min(self.max_workers, len(plan)))
+            executor = ThreadPoolExecutor(max_workers=workers)
+            try:
+                futures = [
+                    executor.submit(self.download_image, img_url, output_folder, filename)
+                    for img_url, filename in plan
+                ]
                 
-                if i % 10 == 0:
-                    print(f"📊 Progress: {i}/{len(image_urls)}")
+                for done, future in enumerate(as_completed(futures), 1):
+                    if future.result():
+                        successful += 1
+                    
+                    if done % 10 == 0:
+                        print(f"📊 Progress: {done}/{len(plan)}")
+            except BaseException:
+                # Stop right away on Ctrl-C instead of draining the queued downloads
+                executor.shutdown(wait=False, cancel_futures=True)
+                raise
+            executor.shutdown()
             
             # Results
             print("\n" + "="*50)
@@ -347,30 +532,32 @@ class PinterestScraper:
         except Exception as e:
             print(f"❌ Error during scraping: {str(e)}")
             raise
-        finally:
-            if hasattr(self, 'driver'):
-                self.driver.quit()
-                print("🔚 Browser closed")
 
 def main():
-    if len(sys.argv) != 3:
-        print("Usage: python pinterest_mac_profile.py <pinterest_board_url> <output_folder>")
+    if len(sys.argv) < 3:
+        print("Usage: python pinterest_mac_profile.py <pinterest_board_url> [<pinterest_board_url> ...] <output_folder>")
         print("Example: python pinterest_mac_profile.py https://ru.pinterest.com/user/board-name/ ./pinterest_images")
         sys.exit(1)
     
-    board_url = sys.argv[1]
-    output_folder = sys.argv[2]
+    board_urls = sys.argv[1:-1]
+    output_folder = sys.argv[-1]
     
-    # Validate URL
-    if not board_url.startswith('https://jp.pinterest.com/'):
-        print("❌ Error: Please provide a valid Pinterest board URL")
-        print("   URL should start with: https://jp.pinterest.com/")
-        sys.exit(1)
+    # Validate URLs
+    for board_url in board_urls:
+        if not board_url.startswith('https://jp.pinterest.com/'):
+            print(f"❌ Error: Please provide a valid Pinterest board URL: {board_url}")
+            print("   URL should start with: https://jp.pinterest.com/")
+            sys.exit(1)
     
     try:
         # Start with visible browser to allow manual login if needed
-        scraper = PinterestScraper(headless=False)
-        scraper.scrape_board(board_url, output_folder)
+        with PinterestScraper(headless=False) as scraper:
+            for board_url in board_urls:
+                # Give each board its own subfolder when scraping several
+                board_folder = output_folder
+                if len(board_urls) > 1:
+                    board_folder = os.path.join(output_folder, board_url.rstrip('/').rsplit('/', 1)[-1])
+                scraper.scrape_board(board_url, board_folder)
     except KeyboardInterrupt:
         print("\n⏹️  Scraping interrupted by user")
     except Exception as e: